@@ -12,6 +12,7 @@ import sys
 import warnings
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from copy import copy
+from functools import cached_property
 from json import JSONDecodeError
 from math import ceil
 from os import environ
@@ -28,7 +29,7 @@ from tqdm.auto import tqdm
 from urllib3.util.retry import Retry
 
 from mp_api.client.core.settings import MAPIClientSettings
-from mp_api.client.core.utils import api_sanitize, validate_ids
+from mp_api.client.core.utils import ResponseCache, api_sanitize, validate_ids
 
 try:
     import boto3
@@ -37,6 +38,11 @@ try:
 except ImportError:
     boto3 = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from pymatgen.core import __version__ as pmg_version  # type: ignore
 except ImportError:  # pragma: no cover
@@ -57,6 +63,24 @@ class BaseRester(Generic[T]):
     document_model: BaseModel = None  # type: ignore
     supports_versions: bool = False
     primary_key: str = "material_id"
+    attr_name: str | None = None
+    parent_name: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the attribute name a rester is exposed under in MPRester.
+
+        Top level and core resters use the first part of their suffix, nested
+        resters join the remaining parts (e.g. "materials/xas" -> "xas") and
+        record the core rester they hang off in parent_name.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.suffix:
+            suffix_split = cls.suffix.split("/")
+            if len(suffix_split) == 1 or suffix_split[1] == "core":
+                cls.attr_name, cls.parent_name = suffix_split[0], None
+            else:
+                cls.attr_name = "_".join(suffix_split[1:])
+                cls.parent_name = suffix_split[0]
 
     def __init__(
         self,
@@ -70,6 +94,7 @@ class BaseRester(Generic[T]):
         use_document_model: bool = True,
         timeout: int = 20,
         headers: dict = None,
+        response_cache: ResponseCache | None = None,
     ):
         """Args:
         api_key (str): A String API key for accessing the MaterialsProject
@@ -97,6 +122,8 @@ class BaseRester(Generic[T]):
         and will not give auto-complete for available fields.
         timeout: Time in seconds to wait until a request timeout error is thrown
         headers (dict): Custom headers for localhost connections.
+        response_cache (ResponseCache): Cache used to reuse the results of identical queries.
+        By default (None), no responses are cached.
         """
         self.api_key = api_key or DEFAULT_API_KEY
         self.base_endpoint = endpoint
@@ -107,6 +134,8 @@ class BaseRester(Generic[T]):
         self.use_document_model = use_document_model
         self.timeout = timeout
         self.headers = headers or {}
+        self.response_cache = response_cache
+        self._returned_models = {}  # type: dict
 
         if self.suffix:
             self.endpoint = urljoin(self.endpoint, self.suffix)
@@ -174,7 +203,12 @@ class BaseRester(Generic[T]):
             status_forcelist=[429, 504, 502],  # rate limiting
             backoff_factor=settings.BACKOFF_FACTOR,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # Size the pool to match the number of parallel requests so that
+        # concurrent page fetches reuse warm keep-alive connections
+        adapter = HTTPAdapter(
+            pool_maxsize=settings.NUM_PARALLEL_REQUESTS,
+            max_retries=retry,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -190,6 +224,35 @@ class BaseRester(Generic[T]):
             self.session.close()
         self._session = None
 
+    def _decode_response(self, response: requests.Response) -> dict:
+        """Decode the JSON body of a successful response.
+
+        The raw bytes are parsed directly, skipping the character set detection
+        done by response.text, and orjson is used when it is installed.
+
+        Arguments:
+            response: response returned by the server
+
+        Returns:
+            Decoded response data, MontyDecoded if self.monty_decode is True
+        """
+        data = None
+
+        if orjson is not None:
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # fall back to the standard library, e.g. for NaN values
+                pass
+
+        if data is None:
+            data = json.loads(response.content)
+
+        if self.monty_decode:
+            data = MontyDecoder().process_decoded(data)
+
+        return data
+
     def _post_resource(
         self,
         body: dict = None,
@@ -224,10 +287,7 @@ class BaseRester(Generic[T]):
             response = self.session.post(url, json=payload, verify=True, params=params)
 
             if response.status_code == 200:
-                if self.monty_decode:
-                    data = json.loads(response.text, cls=MontyDecoder)
-                else:
-                    data = json.loads(response.text)
+                data = self._decode_response(response)
 
                 if self.document_model and use_document_model:
                     if isinstance(data["data"], dict):
@@ -294,10 +354,7 @@ class BaseRester(Generic[T]):
             response = self.session.patch(url, json=payload, verify=True, params=params)
 
             if response.status_code == 200:
-                if self.monty_decode:
-                    data = json.loads(response.text, cls=MontyDecoder)
-                else:
-                    data = json.loads(response.text)
+                data = self._decode_response(response)
 
                 if self.document_model and use_document_model:
                     if isinstance(data["data"], dict):
@@ -405,6 +462,24 @@ class BaseRester(Generic[T]):
                 if not url.endswith("/"):
                     url += "/"
 
+            cache_key = None
+
+            if self.response_cache is not None:
+                # Build the key up front as _submit_requests modifies criteria in place
+                cache_key = (
+                    url,
+                    json.dumps(criteria, sort_keys=True, default=str),
+                    use_document_model,
+                    self.monty_decode,
+                    parallel_param,
+                    num_chunks,
+                    chunk_size,
+                )
+
+                data = self.response_cache.get(cache_key)
+                if data is not None:
+                    return data
+
             data = self._submit_requests(
                 url=url,
                 criteria=criteria,
@@ -415,6 +490,9 @@ class BaseRester(Generic[T]):
                 timeout=timeout,
             )
 
+            if cache_key is not None:
+                self.response_cache.set(cache_key, data)  # type: ignore
+
             return data
 
         except RequestException as ex:
@@ -547,7 +625,7 @@ class BaseRester(Generic[T]):
         ]
 
         initial_data_tuples = self._multi_thread(
-            use_document_model, initial_params_list
+            use_document_model, initial_params_list, timeout=timeout
         )
 
         for data, subtotal, crit_ind in initial_data_tuples:
@@ -599,7 +677,7 @@ class BaseRester(Generic[T]):
             # Obtain missing initial data after rebalancing
             if len(rebalance_params) > 0:
                 rebalance_data_tuples = self._multi_thread(
-                    use_document_model, rebalance_params
+                    use_document_model, rebalance_params, timeout=timeout
                 )
 
                 for data, _, _ in rebalance_data_tuples:
@@ -748,6 +826,7 @@ class BaseRester(Generic[T]):
                 future = executor.submit(
                     self._submit_request_and_process,
                     use_document_model=use_document_model,
+                    timeout=timeout,
                     **params,
                 )
 
@@ -820,10 +899,7 @@ class BaseRester(Generic[T]):
             )
 
         if response.status_code == 200:
-            if self.monty_decode:
-                data = json.loads(response.text, cls=MontyDecoder)
-            else:
-                data = json.loads(response.text)
+            data = self._decode_response(response)
 
             # other sub-urls may use different document models
             # the client does not handle this in a particularly smart way currently
@@ -834,6 +910,7 @@ class BaseRester(Generic[T]):
                     data_model, set_fields, _ = self._generate_returned_model(
                         raw_doc_list[0]
                     )
+                    set_fields = set(set_fields)
 
                     data["data"] = [
                         data_model(
@@ -873,11 +950,16 @@ class BaseRester(Generic[T]):
             )
 
     def _generate_returned_model(self, doc):
-        set_fields = [
-            field for field, _ in doc if field in doc.dict(exclude_unset=True)
-        ]
+        doc_set_fields = doc.dict(exclude_unset=True)
+        set_fields = [field for field, _ in doc if field in doc_set_fields]
         unset_fields = [field for field in doc.__fields__ if field not in set_fields]
 
+        # Reuse the model generated for the same set of fields, e.g. by an earlier
+        # page of results, so that all returned documents share a single class
+        model_key = tuple(set_fields)
+        if model_key in self._returned_models:
+            return self._returned_models[model_key], set_fields, unset_fields
+
         data_model = create_model(
             "MPDataDoc",
             fields_not_requested=unset_fields,
@@ -932,6 +1014,8 @@ class BaseRester(Generic[T]):
         data_model.__getattr__ = new_getattr
         data_model.dict = new_dict
 
+        self._returned_models[model_key] = data_model
+
         return data_model, set_fields, unset_fields
 
     def _query_resource_data(
@@ -1100,13 +1184,14 @@ class BaseRester(Generic[T]):
         query_params["_limit"] = chunk_size
 
         # Check if specific parameters are present that can be parallelized over
+        no_parallel_params = frozenset(MAPIClientSettings().QUERY_NO_PARALLEL)
         list_entries = sorted(
             (
                 (key, len(entry.split(",")))
                 for key, entry in query_params.items()
                 if isinstance(entry, str)
                 and len(entry.split(",")) > 0
-                and key not in MAPIClientSettings().QUERY_NO_PARALLEL
+                and key not in no_parallel_params
             ),
             key=lambda item: item[1],
             reverse=True,
@@ -1148,7 +1233,7 @@ class BaseRester(Generic[T]):
         except Exception:  # pragma: no cover
             return "Problem getting count"
 
-    @property
+    @cached_property
     def available_fields(self) -> list[str]:
         if self.document_model is None:
             return ["Unknown fields."]
@@ -78,6 +78,21 @@ class MAPIClientSettings(BaseSettings):
         description="Number of characters to use to define the maximum length of a given HTTP URL.",
     )
 
+    DB_VERSION_CACHE_TTL: float = Field(
+        3600,
+        description="Number of seconds to reuse the database version before checking the server again.",
+    )
+
+    RESPONSE_CACHE_SIZE: int = Field(
+        128,
+        description="Maximum number of query responses cached by MPRester when caching is enabled.",
+    )
+
+    RESPONSE_CACHE_TTL: float = Field(
+        3600,
+        description="Number of seconds after which a cached query response is discarded.",
+    )
+
     MIN_EMMET_VERSION: str = Field(
         "0.54.0", description="Minimum compatible version of emmet-core for the client."
     )
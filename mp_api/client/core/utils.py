@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import re
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
 from functools import cache
-from typing import get_args
+from typing import Any, get_args
 
 from monty.json import MSONable
 from pydantic import BaseModel
@@ -113,3 +117,56 @@ def allow_msonable_dict(monty_cls: type[MSONable]):
     monty_cls.validate_monty = classmethod(validate_monty)
 
     return monty_cls
+
+
+class ResponseCache:
+    """Thread-safe least recently used cache for API responses.
+
+    Entries expire after a fixed time to live. Values are copied on the way in
+    and out so that callers cannot modify cached documents.
+
+    Args:
+        maxsize (int): Maximum number of responses to keep.
+        ttl (float): Time in seconds after which a cached response is discarded.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        """Get a copy of a cached value, or None if it is missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            value, stored_at = item
+            if time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+
+        return deepcopy(value)
+
+    def set(self, key: Any, value: Any):
+        """Store a copy of a value, evicting the least recently used entries if needed."""
+        value = deepcopy(value)
+
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
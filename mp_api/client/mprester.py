@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import itertools
+import threading
+import time
 import warnings
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from functools import cache, lru_cache
 from json import loads
 from os import environ
@@ -15,16 +20,18 @@ from emmet.core.vasp.calc_types import CalcType
 from packaging import version
 from pymatgen.analysis.phase_diagram import PhaseDiagram
 from pymatgen.analysis.pourbaix_diagram import IonEntry
+from pymatgen.analysis.wulff import WulffShape
 from pymatgen.core import Element, Structure
 from pymatgen.core.ion import Ion
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 from pymatgen.io.vasp import Chgcar
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from requests import Session, get
+from requests.exceptions import RequestException
 
 from mp_api.client.core import BaseRester, MPRestError
 from mp_api.client.core.settings import MAPIClientSettings
-from mp_api.client.core.utils import validate_ids
+from mp_api.client.core.utils import ResponseCache, validate_ids
 from mp_api.client.routes import GeneralStoreRester, MessagesRester, UserSettingsRester
 from mp_api.client.routes.materials import (
     AbsorptionRester,
@@ -73,6 +80,28 @@ DEFAULT_API_KEY = environ.get("MP_API_KEY", None)
 DEFAULT_ENDPOINT = environ.get("MP_API_ENDPOINT", "https://api.materialsproject.org/")
 
 
+def _nested_rester_getattr(self, attr):
+    """Lazily instantiate nested resters, e.g. MPRester().materials.thermo.
+
+    The rester classes and the function used to create them are set on each core
+    rester by the MPRester that owns it.
+    """
+    sub_rester_classes = self.__dict__.get("_sub_rester_classes", {})
+    if attr in sub_rester_classes:
+        rester = self.__dict__["_init_sub_rester"](sub_rester_classes[attr])
+        setattr(self, attr, rester)
+        return rester
+
+    raise AttributeError(
+        f"{self.__class__.__name__!r} object has no attribute {attr!r}"
+    )
+
+
+# Allow lazy loading of nested resters under materials and molecules
+MaterialsRester.__getattr__ = _nested_rester_getattr
+MoleculeRester.__getattr__ = _nested_rester_getattr
+
+
 class MPRester:
     """Access the new Materials Project API."""
 
@@ -131,6 +160,7 @@ class MPRester:
         use_document_model: bool = True,
         session: Session = None,
         headers: dict = None,
+        enable_cache: bool = False,
     ):
         """Args:
         api_key (str): A String API key for accessing the MaterialsProject
@@ -162,6 +192,11 @@ class MPRester:
         and will not give auto-complete for available fields.
         session (Session): Session object to use. By default (None), the client will create one.
         headers (dict): Custom headers for localhost connections.
+        enable_cache (bool): If True, the results of identical queries are reused for up to
+        RESPONSE_CACHE_TTL seconds instead of being requested again. Cached results are also
+        discarded when get_database_version detects a new database version. Up to
+        RESPONSE_CACHE_SIZE full query results are held in memory, and results are copied when
+        they are stored and retrieved. Defaults to False, which always queries the server.
         """
         if api_key and len(api_key) != 32:
             raise ValueError(
@@ -178,9 +213,38 @@ class MPRester:
             include_user_agent=include_user_agent,
             headers=self.headers,
         )
+        self.include_user_agent = include_user_agent
         self.use_document_model = use_document_model
         self.monty_decode = monty_decode
 
+        self._db_version = None
+        self._db_version_fetched_at = 0.0
+
+        self._response_cache = (
+            ResponseCache(
+                maxsize=_MAPI_SETTINGS.RESPONSE_CACHE_SIZE,
+                ttl=_MAPI_SETTINGS.RESPONSE_CACHE_TTL,
+            )
+            if enable_cache
+            else None
+        )
+        self._conventional_structure_cache = (
+            ResponseCache(
+                maxsize=_MAPI_SETTINGS.RESPONSE_CACHE_SIZE,
+                ttl=_MAPI_SETTINGS.RESPONSE_CACHE_TTL,
+            )
+            if enable_cache
+            else None
+        )
+        self._missing_task_ids = (
+            ResponseCache(
+                maxsize=_MAPI_SETTINGS.RESPONSE_CACHE_SIZE,
+                ttl=_MAPI_SETTINGS.RESPONSE_CACHE_TTL,
+            )
+            if enable_cache
+            else None
+        )
+
         self._deprecated_attributes = [
             "eos",
             "similarity",
@@ -245,8 +309,9 @@ class MPRester:
             self.endpoint += "/"
 
         # Dynamically set rester attributes.
-        # First, materials and molecules top level resters are set.
-        # Nested rested are then setup to be loaded dynamically with custom __getattr__ functions.
+        # Top level resters, including materials and molecules, are instantiated lazily
+        # on first access through __getattr__. Nested resters are then setup to be loaded
+        # dynamically with custom __getattr__ functions.
         self._all_resters = []
 
         # Get all rester classes
@@ -257,120 +322,67 @@ class MPRester:
             else:
                 self._all_resters.append(_cls)
 
-        # Instantiate top level molecules and materials resters and set them as attributes
-        core_suffix = ["molecules/core", "materials/core"]
-
-        core_resters = {
-            cls.suffix.split("/")[0]: cls(
-                api_key=api_key,
-                endpoint=endpoint,
-                include_user_agent=include_user_agent,
-                session=self.session,
-                monty_decode=monty_decode,
-                use_document_model=use_document_model,
-                headers=self.headers,
-            )
-            for cls in self._all_resters
-            if cls.suffix in core_suffix
-        }
-
-        # Set remaining top level resters, or get an attribute-class name mapping
-        # for all sub-resters
-        _sub_rester_suffix_map = {"materials": {}, "molecules": {}}
+        # Map top level attribute names to rester classes, and get an
+        # attribute-class name mapping for all sub-resters. Attribute names are
+        # precomputed from each rester's suffix in BaseRester.__init_subclass__
+        self._rester_classes = {}
+        self._sub_rester_classes = {"materials": {}, "molecules": {}}
 
         for cls in self._all_resters:
-            if cls.suffix not in core_suffix:
-                suffix_split = cls.suffix.split("/")
-
-                if len(suffix_split) == 1:
-                    rester = cls(
-                        api_key=api_key,
-                        endpoint=endpoint,
-                        include_user_agent=include_user_agent,
-                        session=self.session,
-                        monty_decode=monty_decode
-                        if cls not in [TaskRester, ProvenanceRester]  # type: ignore
-                        else False,  # Disable monty decode on nested data which may give errors
-                        use_document_model=use_document_model,
-                        headers=self.headers,
-                    )  # type: BaseRester
-                    setattr(
-                        self,
-                        suffix_split[0],
-                        rester,
-                    )
-                else:
-                    attr = "_".join(suffix_split[1:])
-                    if "materials" in suffix_split:
-                        _sub_rester_suffix_map["materials"][attr] = cls
-                    elif "molecules" in suffix_split:
-                        _sub_rester_suffix_map["molecules"][attr] = cls
-
-        # Allow lazy loading of nested resters under materials and molecules using custom __getattr__ methods
-        def __core_custom_getattr(_self, _attr, _rester_map):
-            if _attr in _rester_map:
-                cls = _rester_map[_attr]
-                rester = cls(
-                    api_key=api_key,
-                    endpoint=endpoint,
-                    include_user_agent=include_user_agent,
-                    session=self.session,
-                    monty_decode=monty_decode
-                    if cls not in [TaskRester, ProvenanceRester]  # type: ignore
-                    else False,  # Disable monty decode on nested data which may give errors
-                    use_document_model=use_document_model,
-                    headers=self.headers,
-                )  # type: BaseRester
-
-                setattr(
-                    _self,
-                    _attr,
-                    rester,
-                )
-
-                return rester
-            else:
-                raise AttributeError(
-                    f"{_self.__class__.__name__!r} object has no attribute {attr!r}"
-                )
-
-        def __materials_getattr__(_self, attr):
-            _rester_map = _sub_rester_suffix_map["materials"]
-            rester = __core_custom_getattr(_self, attr, _rester_map)
-            return rester
-
-        def __molecules_getattr__(_self, attr):
-            _rester_map = _sub_rester_suffix_map["molecules"]
-            rester = __core_custom_getattr(_self, attr, _rester_map)
-            return rester
-
-        MaterialsRester.__getattr__ = __materials_getattr__
-        MoleculeRester.__getattr__ = __molecules_getattr__
-
-        for attr, rester in core_resters.items():
-            setattr(
-                self,
-                attr,
-                rester,
-            )
+            if cls.parent_name is None:
+                self._rester_classes[cls.attr_name] = cls
+            elif cls.parent_name in self._sub_rester_classes:
+                self._sub_rester_classes[cls.parent_name][cls.attr_name] = cls
+
+    def _init_rester(self, cls: type[BaseRester]) -> BaseRester:
+        """Instantiate a rester class with the settings of this MPRester."""
+        return cls(
+            api_key=self.api_key,
+            endpoint=self.endpoint,
+            include_user_agent=self.include_user_agent,
+            session=self.session,
+            monty_decode=self.monty_decode
+            if cls not in [TaskRester, ProvenanceRester]  # type: ignore
+            else False,  # Disable monty decode on nested data which may give errors
+            use_document_model=self.use_document_model,
+            headers=self.headers,
+            response_cache=self._response_cache,
+        )
 
     def __enter__(self):
         """Support for "with" context."""
+        # Open a connection in the background so the first query reuses a warm socket
+        threading.Thread(target=self._warm_session, daemon=True).start()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Support for "with" context."""
         self.session.close()
 
+    def _warm_session(self):
+        """Send a lightweight heartbeat request to prime the session connection pool."""
+        try:
+            self.session.get(url=self.endpoint + "heartbeat", timeout=2)
+        except RequestException:
+            pass
+
     def __getattr__(self, attr):
-        if attr in self._deprecated_attributes:
+        if attr in self._rester_classes:
+            rester = self._init_rester(self._rester_classes[attr])
+            if attr in self._sub_rester_classes:
+                # Nested resters are created with the settings of this MPRester
+                rester._sub_rester_classes = self._sub_rester_classes[attr]
+                rester._init_sub_rester = self._init_rester
+            setattr(self, attr, rester)
+            return rester
+        elif attr in self._deprecated_attributes:
             warnings.warn(
                 f"Accessing {attr} data through MPRester.{attr} is deprecated. "
                 f"Please use MPRester.materials.{attr} instead.",
                 DeprecationWarning,
                 stacklevel=2,
             )
-            return getattr(super().__getattribute__("materials"), attr)
+            return getattr(self.materials, attr)
         else:
             raise AttributeError(
                 f"{self.__class__.__name__!r} object has no attribute {attr!r}"
@@ -387,7 +399,7 @@ class MPRester:
         return super().__getattribute__(attr)
 
     def __dir__(self):
-        return dir(MPRester) + self._deprecated_attributes + ["materials", "molecules"]
+        return dir(MPRester) + self._deprecated_attributes + list(self._rester_classes)
 
     def get_task_ids_associated_with_material_id(
         self, material_id: str, calc_types: list[CalcType] | None = None
@@ -400,6 +412,8 @@ class MPRester:
             material_id, fields=["calc_types"]
         ).calc_types
         if calc_types:
+            # Hash lookups avoid converting strings back to enums on every comparison
+            calc_types = frozenset(calc_types)
             return [
                 task for task, calc_type in tasks.items() if calc_type in calc_types
             ]
@@ -422,23 +436,57 @@ class MPRester:
         Returns:
             Structure object or list of Structure objects.
         """
+        if conventional_unit_cell and final:
+            return self._get_conventional_structure(material_id)
+
         structure_data = self.materials.get_structure_by_material_id(
             material_id=material_id, final=final
         )
 
         if conventional_unit_cell and structure_data:
-            if final:
-                structure_data = SpacegroupAnalyzer(
-                    structure_data
-                ).get_conventional_standard_structure()
-            else:
-                structure_data = [
-                    SpacegroupAnalyzer(structure).get_conventional_standard_structure()
-                    for structure in structure_data
-                ]
+            structure_data = [
+                SpacegroupAnalyzer(structure).get_conventional_standard_structure()
+                for structure in structure_data
+            ]
 
         return structure_data
 
+    def _get_conventional_structure(self, material_id: str) -> Structure | None:
+        """Get the final standard conventional structure for a material_id.
+
+        The symmetry analysis is expensive, so results are cached per material_id
+        when caching is enabled. A new copy of the structure is returned each time.
+
+        Args:
+            material_id (str): Materials Project material_id (a string,
+                e.g., mp-1234).
+
+        Returns:
+            Structure object.
+        """
+        cache = self._conventional_structure_cache
+        if cache is not None:
+            conventional = cache.get(material_id)
+            if conventional is not None:
+                return conventional
+
+        structure = self.materials.get_structure_by_material_id(
+            material_id=material_id, final=True
+        )
+
+        if not structure:
+            return structure
+
+        conventional = SpacegroupAnalyzer(
+            structure
+        ).get_conventional_standard_structure()
+
+        if cache is not None:
+            cache.set(material_id, conventional)
+            return conventional.copy()
+
+        return conventional
+
     def get_database_version(self):
         """The Materials Project database is periodically updated and has a
         database version associated with it. When the database is updated,
@@ -450,9 +498,33 @@ class MPRester:
         where "_DD" may be optional. An additional numerical suffix
         might be added if multiple releases happen on the same day.
 
+        The value is cached for MAPIClientSettings.DB_VERSION_CACHE_TTL seconds.
+
         Returns: database version as a string
         """
-        return get(url=self.endpoint + "heartbeat").json()["db_version"]
+        if (
+            self._db_version is None
+            or time.monotonic() - self._db_version_fetched_at
+            > _MAPI_SETTINGS.DB_VERSION_CACHE_TTL
+        ):
+            db_version = self.session.get(url=self.endpoint + "heartbeat").json()[
+                "db_version"
+            ]
+            self._db_version_fetched_at = time.monotonic()
+
+            # Cached data may be out of date after a database release
+            if self._db_version is not None and db_version != self._db_version:
+                for cache in (
+                    self._response_cache,
+                    self._conventional_structure_cache,
+                    self._missing_task_ids,
+                ):
+                    if cache is not None:
+                        cache.clear()
+
+            self._db_version = db_version
+
+        return self._db_version
 
     @staticmethod
     @cache
@@ -483,18 +555,58 @@ class MPRester:
         Returns:
             material_id (MPID)
         """
-        docs = self.materials.search(task_ids=[task_id], fields=["material_id"])
-        if len(docs) == 1:  # pragma: no cover
-            return str(docs[0].material_id)  # type: ignore
-        elif len(docs) > 1:  # pragma: no cover
-            raise ValueError(
-                f"Multiple documents return for {task_id}, this should not happen, please report it!"
-            )
-        else:  # pragma: no cover
-            warnings.warn(
-                f"No material found containing task {task_id}. Please report it if you suspect a task has gone missing."
-            )
-            return None
+        return self.get_material_ids_from_task_ids([task_id]).get(task_id)
+
+    def get_material_ids_from_task_ids(self, task_ids: list[str]) -> dict[str, str]:
+        """Returns the current material_id for each of a list of task_ids
+        using a single query. See get_material_id_from_task_id for details.
+
+        Args:
+            task_ids (List[str]): A list of task ids.
+
+        Returns:
+            Dictionary mapping each task_id to its material_id. Task ids
+            for which no material is found are omitted.
+        """
+        # Task ids recently found to be missing are not queried again
+        requested_task_ids = {
+            task_id
+            for task_id in task_ids
+            if self._missing_task_ids is None
+            or self._missing_task_ids.get(task_id) is None
+        }
+        material_ids = defaultdict(list)
+
+        if requested_task_ids:
+            for doc in self.materials.search(
+                task_ids=list(requested_task_ids), fields=["material_id", "task_ids"]
+            ):
+                for task_id in doc.task_ids:  # type: ignore
+                    if str(task_id) in requested_task_ids:
+                        material_ids[str(task_id)].append(str(doc.material_id))  # type: ignore
+
+        results = {}
+
+        for task_id in task_ids:
+            matches = material_ids.get(task_id, [])
+            if len(matches) == 1:
+                results[task_id] = matches[0]
+            elif len(matches) > 1:  # pragma: no cover
+                raise ValueError(
+                    f"Multiple documents return for {task_id}, this should not happen, please report it!"
+                )
+            else:  # pragma: no cover
+                # Only record ids that were queried, so the expiry is not pushed back
+                if (
+                    self._missing_task_ids is not None
+                    and task_id in requested_task_ids
+                ):
+                    self._missing_task_ids.set(task_id, True)
+                warnings.warn(
+                    f"No material found containing task {task_id}. Please report it if you suspect a task has gone missing."
+                )
+
+        return results
 
     def get_materials_id_from_task_id(self, task_id: str) -> str | None:
         """This method is deprecated, please use get_material_id_from_task_id."""
@@ -543,13 +655,18 @@ class MPRester:
         else:
             input_params = {"formula": chemsys_formula}
 
+        # Sort on the parsed ID parts, which gives the same numeric ordering as
+        # MPID.__lt__ without re-parsing an ID on every comparison
         return sorted(
-            doc.material_id
-            for doc in self.materials.search(
-                **input_params,  # type: ignore
-                all_fields=False,
-                fields=["material_id"],
-            )
+            (
+                doc.material_id
+                for doc in self.materials.search(
+                    **input_params,  # type: ignore
+                    all_fields=False,
+                    fields=["material_id"],
+                )
+            ),
+            key=lambda mpid: (mpid.parts[0] == "", mpid.parts),
         )
 
     def get_materials_ids(
@@ -594,16 +711,16 @@ class MPRester:
                 )
             ]
         else:
-            structures = []
-
-            for doc in self.materials.search(
-                **input_params,  # type: ignore
-                all_fields=False,
-                fields=["initial_structures"],
-            ):
-                structures.extend(doc.initial_structures)
-
-            return structures
+            return list(
+                itertools.chain.from_iterable(
+                    doc.initial_structures
+                    for doc in self.materials.search(
+                        **input_params,  # type: ignore
+                        all_fields=False,
+                        fields=["initial_structures"],
+                    )
+                )
+            )
 
     def find_structure(
         self,
@@ -713,19 +830,12 @@ class MPRester:
 
         fields = ["entries"] if not property_data else ["entries"] + property_data
 
-        if sort_by_e_above_hull:
-            docs = self.thermo.search(
-                **input_params,  # type: ignore
-                all_fields=False,
-                fields=fields,
-                sort_fields=["energy_above_hull"],
-            )
-        else:
-            docs = self.thermo.search(
-                **input_params,
-                all_fields=False,
-                fields=fields,  # type: ignore
-            )
+        docs = self.materials.thermo.search(
+            **input_params,  # type: ignore
+            all_fields=False,
+            fields=fields,
+            sort_fields=["energy_above_hull"] if sort_by_e_above_hull else None,
+        )
 
         for doc in docs:
             entry_list = (
@@ -733,19 +843,25 @@ class MPRester:
                 if self.use_document_model
                 else doc["entries"].values()
             )
+
+            # Serialize only the requested properties, once per document
+            if property_data:
+                doc_data = (
+                    doc.dict(include=set(property_data))
+                    if self.use_document_model
+                    else doc
+                )
+
             for entry in entry_list:
-                entry_dict = entry.as_dict() if self.monty_decode else entry
+                # Copy raw entries so that the returned documents are not modified
+                entry_dict = entry.as_dict() if self.monty_decode else deepcopy(entry)
                 if not compatible_only:
                     entry_dict["correction"] = 0.0
                     entry_dict["energy_adjustments"] = []
 
                 if property_data:
                     for property in property_data:
-                        entry_dict["data"][property] = (
-                            doc.dict()[property]
-                            if self.use_document_model
-                            else doc[property]
-                        )
+                        entry_dict["data"][property] = doc_data[property]
 
                 if conventional_unit_cell:
                     entry_struct = Structure.from_dict(entry_dict["structure"])
@@ -1170,18 +1286,13 @@ class MPRester:
             for els in itertools.combinations(elements_set, i + 1):
                 all_chemsyses.append("-".join(sorted(els)))
 
-        entries = []  # type: List[ComputedEntry]
-
-        entries.extend(
-            self.get_entries(
-                all_chemsyses,
-                compatible_only=compatible_only,
-                inc_structure=inc_structure,
-                property_data=property_data,
-                conventional_unit_cell=conventional_unit_cell,
-                additional_criteria=additional_criteria
-                or {"thermo_types": ["GGA_GGA+U"]},
-            )
+        entries = self.get_entries(
+            all_chemsyses,
+            compatible_only=compatible_only,
+            inc_structure=inc_structure,
+            property_data=property_data,
+            conventional_unit_cell=conventional_unit_cell,
+            additional_criteria=additional_criteria or {"thermo_types": ["GGA_GGA+U"]},
         )
 
         if not self.monty_decode:
@@ -1262,22 +1373,30 @@ class MPRester:
         Returns:
             pymatgen.analysis.wulff.WulffShape
         """
-        from pymatgen.analysis.wulff import WulffShape
-        from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
-
-        structure = self.get_structure_by_material_id(material_id)
-        surfaces = surfaces = self.surface_properties.get_data_by_id(
-            material_id
-        ).surfaces
-        lattice = (
-            SpacegroupAnalyzer(structure).get_conventional_standard_structure().lattice
-        )
+        # The structure and surface data are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            structure_future = executor.submit(
+                self._get_conventional_structure, material_id
+            )
+            surfaces_future = executor.submit(
+                self.materials.surface_properties.get_data_by_id,
+                material_id,
+                fields=["surfaces"],
+            )
+            lattice = structure_future.result().lattice
+            surfaces = surfaces_future.result().surfaces
+        # Prefer reconstructed surfaces, which have lower surface energies,
+        # and keep the lowest energy when a Miller index appears more than once.
+        # Surfaces without an energy sort last rather than failing the comparison.
         miller_energy_map = {}
-        for surf in surfaces:
-            miller = tuple(surf.miller_index)
-            # Prefer reconstructed surfaces, which have lower surface energies.
-            if (miller not in miller_energy_map) or surf.is_reconstructed:
-                miller_energy_map[miller] = surf.surface_energy
+        for surf in sorted(
+            surfaces,
+            key=lambda s: (
+                not s.is_reconstructed,
+                float("inf") if s.surface_energy is None else s.surface_energy,
+            ),
+        ):
+            miller_energy_map.setdefault(tuple(surf.miller_index), surf.surface_energy)
         millers, energies = zip(*miller_energy_map.items())
         return WulffShape(lattice, millers, energies)
 
@@ -1350,13 +1469,15 @@ class MPRester:
             else []
         )
 
+        calc_type_set = frozenset(calc_types)
+
         meta = {}
         for doc in self.materials.search(
             task_ids=material_ids,
             fields=["calc_types", "deprecated_tasks", "material_id"],
         ):
             for task_id, calc_type in doc.calc_types.items():
-                if calc_types and calc_type not in calc_types:
+                if calc_type_set and calc_type not in calc_type_set:
                     continue
                 mp_id = doc.material_id
                 if meta.get(mp_id) is None:
@@ -1,9 +1,11 @@
 import os
 
 import pytest
+from packaging import version
 
 from mp_api.client import MPRester
 from mp_api.client.core import BaseRester
+from mp_api.client.core.utils import ResponseCache
 
 
 @pytest.fixture
@@ -57,3 +59,126 @@ def test_get_document_no_doc(mpr):
 def test_available_fields(rester, mpr):
     assert len(mpr.materials.available_fields) > 0
     assert rester.available_fields == ["Unknown fields."]
+
+
+def test_response_cache():
+    cache = ResponseCache(maxsize=2, ttl=3600)
+    cache.set("a", {"data": [1]})
+    cache.set("b", {"data": [2]})
+
+    # Cached values are copies
+    data = cache.get("a")
+    data["data"].append(3)
+    assert cache.get("a") == {"data": [1]}
+
+    # Least recently used entry is evicted
+    cache.set("c", {"data": [4]})
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.clear()
+    assert cache.get("a") is None
+
+    expired_cache = ResponseCache(maxsize=2, ttl=-1)
+    expired_cache.set("a", {"data": [1]})
+    assert expired_cache.get("a") is None
+
+
+def test_query_resource_cache(monkeypatch):
+    rester = BaseRester(response_cache=ResponseCache(maxsize=2, ttl=3600))
+    calls = []
+
+    def submit_requests(**kwargs):
+        calls.append(kwargs["criteria"].get("_fields"))
+        return {"data": [{"material_id": "mp-149"}], "meta": {}}
+
+    monkeypatch.setattr(rester, "_submit_requests", submit_requests)
+
+    data = rester._query_resource(criteria={"formula": "Si"}, fields=["material_id"])
+    assert rester._query_resource(
+        criteria={"formula": "Si"}, fields=["material_id"]
+    ) == data
+    assert calls == ["material_id"]
+
+    # Different fields are a cache miss
+    rester._query_resource(criteria={"formula": "Si"}, fields=["formula_pretty"])
+    assert calls == ["material_id", "formula_pretty"]
+
+    rester.session.close()
+
+
+def test_query_resource_cache_disabled(monkeypatch):
+    monkeypatch.setattr(
+        MPRester, "get_emmet_version", lambda endpoint: version.parse("0.67.5")
+    )
+    mpr = MPRester(api_key="a" * 32, enable_cache=False)
+    rester = mpr.materials
+    assert rester.response_cache is None
+
+    calls = []
+
+    def submit_requests(**kwargs):
+        calls.append(kwargs["criteria"].get("_fields"))
+        return {"data": [], "meta": {}}
+
+    monkeypatch.setattr(rester, "_submit_requests", submit_requests)
+
+    rester._query_resource(criteria={"formula": "Si"}, fields=["material_id"])
+    rester._query_resource(criteria={"formula": "Si"}, fields=["material_id"])
+    assert len(calls) == 2
+
+    mpr.session.close()
+
+
+def test_query_resource_cache_get_entries(monkeypatch):
+    monkeypatch.setattr(
+        MPRester, "get_emmet_version", lambda endpoint: version.parse("0.67.5")
+    )
+    mpr = MPRester(
+        api_key="a" * 32,
+        enable_cache=True,
+        monty_decode=False,
+        use_document_model=False,
+    )
+    rester = mpr.materials.thermo
+    entry = {
+        "energy": -10.0,
+        "composition": {"Si": 2.0},
+        "correction": -1.5,
+        "energy_adjustments": [{"value": -1.5}],
+        "data": {},
+    }
+    calls = []
+
+    def submit_requests(**kwargs):
+        calls.append(kwargs["criteria"])
+        return {"data": [{"entries": {"GGA": entry}}], "meta": {"total_doc": 1}}
+
+    monkeypatch.setattr(rester, "_submit_requests", submit_requests)
+
+    assert mpr.get_entries("mp-149", compatible_only=False)[0]["correction"] == 0.0
+
+    # Modifying the first result must not change the cached response
+    cached_entry = mpr.get_entries("mp-149", compatible_only=True)[0]
+    assert len(calls) == 1
+    assert cached_entry["correction"] == -1.5
+    assert cached_entry["energy_adjustments"] == [{"value": -1.5}]
+
+    mpr.session.close()
+
+
+def test_nested_rester_settings(monkeypatch):
+    monkeypatch.setattr(
+        MPRester, "get_emmet_version", lambda endpoint: version.parse("0.67.5")
+    )
+    cached = MPRester(api_key="a" * 32, enable_cache=True)
+    uncached = MPRester(api_key="b" * 32)
+
+    # Nested resters use the settings of the MPRester they were accessed through
+    assert cached.materials.thermo.response_cache is not None
+    assert cached.materials.thermo.session is cached.session
+    assert uncached.materials.thermo.response_cache is None
+    assert uncached.molecules.summary.session is uncached.session
+
+    cached.session.close()
+    uncached.session.close()
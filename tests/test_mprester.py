@@ -54,9 +54,18 @@ class TestMPRester:
         db_version = mpr.get_database_version()
         assert db_version is not None
 
+        # Subsequent calls are served from the cache
+        assert mpr.get_database_version() == db_version
+
     def test_get_materials_id_from_task_id(self, mpr):
         assert mpr.get_materials_id_from_task_id("mp-540081") == "mp-19017"
 
+    def test_get_material_ids_from_task_ids(self, mpr):
+        assert mpr.get_material_ids_from_task_ids(["mp-540081"]) == {
+            "mp-540081": "mp-19017"
+        }
+        assert mpr.get_material_ids_from_task_ids([]) == {}
+
     def test_get_task_ids_associated_with_material_id(self, mpr):
         results = mpr.get_task_ids_associated_with_material_id(
             "mp-149", calc_types=[CalcType.GGA_Static, CalcType.GGA_U_Static]